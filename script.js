@@ -3,225 +3,546 @@
 // ==========================================
 
 class SteganographyEngine {
-    static DELIMITER = '1111111111111110'; // Special pattern to mark end of data
-
-    // Convert text to binary string
-    static textToBinary(text) {
-        return text.split('').map(char => {
-            return char.charCodeAt(0).toString(2).padStart(8, '0');
-        }).join('');
-    }
-
-    // Convert binary string to text
-    static binaryToText(binary) {
-        let text = '';
-        for (let i = 0; i < binary.length; i += 8) {
-            const byte = binary.substr(i, 8);
-            if (byte.length === 8) {
-                text += String.fromCharCode(parseInt(byte, 2));
-            }
-        }
-        return text;
+    static HEADER_BYTES = 4; // 32-bit big-endian payload length stored ahead of the data
+    static LEGACY_DELIMITER = 0xFFFE; // 1111111111111110, end-of-data marker of the old format
+    static WORKER_CHUNK_BYTES = 48 * 1024; // Payload bytes between progress updates (multiple of 3)
+
+    static worker = null;
+    static workerReady = false; // set once the worker script has loaded and said so
+    static workerUnavailable = false;
+    static jobs = new Map();
+    static nextJobId = 0;
+    static extractedPayloads = new WeakMap(); // decoded image -> Promise of { data, legacy }
+
+    // Convert text to UTF-8 bytes
+    static textToBytes(text) {
+        return new TextEncoder().encode(text);
     }
 
-    // SHA-256 hash function
+    // Convert UTF-8 bytes to text; old-format data held one Latin-1 byte per character
+    static bytesToText(bytes, legacy = false) {
+        return new TextDecoder(legacy ? 'latin1' : 'utf-8').decode(bytes);
+    }
+
+    // SHA-256 hash function (raw 32-byte digest)
     static async sha256(message) {
         const msgBuffer = new TextEncoder().encode(message);
         const hashBuffer = await crypto.subtle.digest('SHA-256', msgBuffer);
-        const hashArray = Array.from(new Uint8Array(hashBuffer));
-        return hashArray.map(b => b.toString(16).padStart(2, '0')).join('');
+        return new Uint8Array(hashBuffer);
     }
 
-    // Encode data into image using LSB steganography
-    static async encodeImage(imageFile, data, password = '') {
-        return new Promise(async (resolve, reject) => {
-            try {
-                const img = new Image();
-                const reader = new FileReader();
-
-                reader.onload = async (e) => {
-                    img.onload = async () => {
-                        try {
-                            // Create canvas
-                            const canvas = document.createElement('canvas');
-                            const ctx = canvas.getContext('2d');
-                            canvas.width = img.width;
-                            canvas.height = img.height;
-                            
-                            // Draw image
-                            ctx.drawImage(img, 0, 0);
-                            
-                            // Get image data
-                            const imageData = ctx.getImageData(0, 0, canvas.width, canvas.height);
-                            const pixels = imageData.data;
-
-                            // Prepare data with password if provided
-                            let binaryData = data;
-                            if (password) {
-                                const passwordHash = await this.sha256(password);
-                                const hashBinary = this.textToBinary(passwordHash);
-                                binaryData = hashBinary + data;
-                            }
+    // Compare two byte arrays for equality
+    static bytesEqual(a, b) {
+        if (a.length !== b.length) return false;
+        for (let i = 0; i < a.length; i++) {
+            if (a[i] !== b[i]) return false;
+        }
+        return true;
+    }
 
-                            // Add delimiter
-                            binaryData += this.DELIMITER;
+    // Write payload bits (MSB-first) into the RGB LSBs of an RGBA pixel buffer.
+    // Kept as a small monomorphic loop so the JIT can compile it tightly.
+    static embedBytes(pixels, payload, start = 0, end = payload.length) {
+        let k = start;
+
+        // Fast path: spread each 3-byte group over 8 pixel words, clearing and setting
+        // the three RGB LSBs of a pixel with a single masked write
+        const littleEndian = new Uint8Array(Uint32Array.of(1).buffer)[0] === 1;
+        if (littleEndian && start % 3 === 0 && pixels.byteOffset % 4 === 0) {
+            const words = new Uint32Array(pixels.buffer, pixels.byteOffset, pixels.length >> 2);
+            // Deposit table: 3-bit RGB group -> its bits placed at the R, G and B LSB positions
+            const spread = Uint32Array.of(0x00000, 0x10000, 0x00100, 0x10100, 0x00001, 0x10001, 0x00101, 0x10101);
+            let w = start / 3 * 8;
+            for (; k + 3 <= end; k += 3) {
+                const group = (payload[k] << 16) | (payload[k + 1] << 8) | payload[k + 2];
+                for (let n = 21; n >= 0; n -= 3) {
+                    words[w] = (words[w] & 0xFFFEFEFE) | spread[(group >>> n) & 7];
+                    w++;
+                }
+            }
+        }
 
-                            // Check capacity
-                            const maxCapacity = pixels.length / 4 * 3; // RGB channels only
-                            if (binaryData.length > maxCapacity) {
-                                reject(new Error('Image too small for data. Please use a larger image.'));
-                                return;
-                            }
+        // Remaining bytes, one channel at a time
+        let p = k * 8 + Math.floor(k * 8 / 3); // channel cursor; alpha slots are skipped
+        for (; k < end; k++) {
+            const byte = payload[k];
+            for (let shift = 7; shift >= 0; shift--) {
+                // Clear LSB and set new bit
+                pixels[p] = (pixels[p] & 0xFE) | ((byte >> shift) & 1);
+                p += 1 + ((p >> 1) & ~p & 1); // skip alpha: +2 when p & 3 === 2
+            }
+        }
+    }
 
-                            // Embed data using LSB
-                            let dataIndex = 0;
-                            for (let i = 0; i < pixels.length; i += 4) {
-                                // Modify RGB channels (skip alpha)
-                                for (let j = 0; j < 3; j++) {
-                                    if (dataIndex < binaryData.length) {
-                                        // Clear LSB and set new bit
-                                        pixels[i + j] = (pixels[i + j] & 0xFE) | parseInt(binaryData[dataIndex]);
-                                        dataIndex++;
-                                    }
-                                }
-                            }
+    // Fill bytes (MSB-first) from the RGB LSBs of an RGBA pixel buffer
+    static extractBytes(pixels, bytes, start = 0, end = bytes.length) {
+        let k = start;
+
+        // Fast path: read each pixel as one 32-bit word and gather its three RGB LSBs at once;
+        // 8 pixels carry exactly 3 bytes, so whole groups need no per-channel bookkeeping
+        const littleEndian = new Uint8Array(Uint32Array.of(1).buffer)[0] === 1;
+        if (littleEndian && start % 3 === 0 && pixels.byteOffset % 4 === 0) {
+            const words = new Uint32Array(pixels.buffer, pixels.byteOffset, pixels.length >> 2);
+            let w = start / 3 * 8;
+            for (; k + 3 <= end; k += 3) {
+                let group = 0;
+                for (let n = 0; n < 8; n++) {
+                    // One multiply moves the R, G and B LSBs (bits 0, 8, 16) to bits 18, 17, 16
+                    group = (group << 3) | ((Math.imul(words[w++] & 0x10101, 0x40201) >>> 16) & 7);
+                }
+                bytes[k] = group >>> 16;
+                bytes[k + 1] = (group >>> 8) & 0xFF;
+                bytes[k + 2] = group & 0xFF;
+            }
+        }
 
-                            // Put modified data back
-                            ctx.putImageData(imageData, 0, 0);
+        // Remaining bytes, one channel at a time
+        let p = k * 8 + Math.floor(k * 8 / 3); // channel cursor; alpha slots are skipped
+        for (; k < end; k++) {
+            let byte = 0;
+            for (let n = 0; n < 8; n++) {
+                byte = (byte << 1) | (pixels[p] & 1);
+                p += 1 + ((p >> 1) & ~p & 1); // skip alpha: +2 when p & 3 === 2
+            }
+            bytes[k] = byte;
+        }
+        return bytes;
+    }
 
-                            // Convert to blob
-                            canvas.toBlob((blob) => {
-                                resolve(blob);
-                            }, 'image/png');
+    // Lazily start a worker running the LSB kernels; null if workers are unavailable
+    static getWorker() {
+        if (this.worker || this.workerUnavailable) return this.worker;
 
-                        } catch (err) {
-                            reject(err);
+        try {
+            const source = `
+                const kernels = { ${this.embedBytes}, ${this.extractBytes} };
+                const CHUNK = ${this.WORKER_CHUNK_BYTES};
+
+                self.onmessage = (e) => {
+                    const { id, op, pixels, payload, byteCount } = e.data;
+                    try {
+                        const total = op === 'embed' ? payload.length : byteCount;
+                        const bytes = op === 'embed' ? null : new Uint8Array(byteCount);
+                        for (let start = 0; start < total; start += CHUNK) {
+                            const end = Math.min(start + CHUNK, total);
+                            if (op === 'embed') {
+                                kernels.embedBytes(pixels, payload, start, end);
+                            } else {
+                                kernels.extractBytes(pixels, bytes, start, end);
+                            }
+                            self.postMessage({ id, progress: end / total });
                         }
-                    };
-                    img.src = e.target.result;
+                        const result = op === 'embed' ? pixels : bytes;
+                        self.postMessage({ id, result }, [result.buffer]);
+                    } catch (err) {
+                        self.postMessage({ id, error: err.message });
+                    }
                 };
+                self.postMessage({ ready: true });
+            `;
+            const url = URL.createObjectURL(new Blob([source], { type: 'text/javascript' }));
+            this.worker = new Worker(url);
+            URL.revokeObjectURL(url);
+        } catch (err) {
+            this.workerUnavailable = true;
+            return null;
+        }
+
+        this.worker.onmessage = (e) => {
+            const { id, ready, progress, result, error } = e.data;
+            if (ready) {
+                // Jobs queued while the script loaded can now be handed over
+                this.workerReady = true;
+                this.jobs.forEach((job, jobId) => this.postJob(jobId, job));
+                return;
+            }
 
-                reader.onerror = () => reject(new Error('Failed to read image file'));
-                reader.readAsDataURL(imageFile);
+            const job = this.jobs.get(id);
+            if (!job) return;
 
-            } catch (err) {
-                reject(err);
+            if (progress !== undefined) {
+                if (job.onProgress) job.onProgress(progress);
+                return;
+            }
+
+            this.jobs.delete(id);
+            if (error) {
+                job.reject(new Error(error));
+            } else {
+                job.resolve(result);
             }
+        };
+        this.worker.onerror = (e) => {
+            e.preventDefault();
+            if (!this.workerReady) {
+                // The script never loaded (e.g. blob: workers blocked by CSP): stop using
+                // workers and run the queued jobs, whose buffers were never sent, inline
+                this.worker.terminate();
+                this.worker = null;
+                this.workerUnavailable = true;
+                this.jobs.forEach(job => {
+                    try {
+                        job.resolve(this.runKernelInline(job.op, job.message, job.onProgress));
+                    } catch (err) {
+                        job.reject(err);
+                    }
+                });
+            } else {
+                this.jobs.forEach(job => job.reject(new Error('Image processing failed')));
+            }
+            this.jobs.clear();
+        };
+
+        return this.worker;
+    }
+
+    // Run an LSB kernel off the main thread, falling back to running it inline
+    static runKernel(op, message, onProgress) {
+        if (!this.getWorker()) {
+            return Promise.resolve(this.runKernelInline(op, message, onProgress));
+        }
+
+        return new Promise((resolve, reject) => {
+            const id = this.nextJobId++;
+            const job = { resolve, reject, onProgress, op, message };
+            this.jobs.set(id, job);
+            // Until the worker has loaded, keep the job so it can still run inline
+            if (this.workerReady) this.postJob(id, job);
         });
     }
 
-    // Decode data from image using LSB steganography
-    static async decodeImage(imageFile, password = '') {
-        return new Promise(async (resolve, reject) => {
+    // Send a job to the worker
+    static postJob(id, job) {
+        const { op, message } = job;
+        job.message = null;
+        // Hand the buffers over instead of copying them; callers don't reuse them
+        const transfer = [message.pixels.buffer];
+        if (message.payload) transfer.push(message.payload.buffer);
+        this.worker.postMessage({ id, op, ...message }, transfer);
+    }
+
+    // Run an LSB kernel on the calling thread
+    static runKernelInline(op, message, onProgress) {
+        const result = op === 'embed'
+            ? (this.embedBytes(message.pixels, message.payload), message.pixels)
+            : this.extractBytes(message.pixels, new Uint8Array(message.byteCount));
+        if (onProgress) onProgress(1);
+        return result;
+    }
+
+    // Decode an image file, preferring createImageBitmap and falling back to an image element
+    static async loadImage(imageFile) {
+        if (typeof createImageBitmap === 'function') {
             try {
+                return await createImageBitmap(imageFile);
+            } catch (err) {
+                // Some browsers reject certain formats here; the element decoder still handles them
+            }
+        }
+        return this.loadImageElement(imageFile);
+    }
+
+    // Read an image file through a data URL and decode it into an image element
+    static loadImageElement(imageFile) {
+        return new Promise((resolve, reject) => {
+            const reader = new FileReader();
+
+            reader.onload = (e) => {
                 const img = new Image();
-                const reader = new FileReader();
-
-                reader.onload = async (e) => {
-                    img.onload = async () => {
-                        try {
-                            // Create canvas
-                            const canvas = document.createElement('canvas');
-                            const ctx = canvas.getContext('2d');
-                            canvas.width = img.width;
-                            canvas.height = img.height;
-                            
-                            // Draw image
-                            ctx.drawImage(img, 0, 0);
-                            
-                            // Get image data
-                            const imageData = ctx.getImageData(0, 0, canvas.width, canvas.height);
-                            const pixels = imageData.data;
-
-                            // Extract LSBs
-                            let binaryData = '';
-                            for (let i = 0; i < pixels.length; i += 4) {
-                                // Extract from RGB channels
-                                for (let j = 0; j < 3; j++) {
-                                    binaryData += (pixels[i + j] & 1).toString();
-                                }
-                            }
+                img.onload = () => resolve(img);
+                img.onerror = () => reject(new Error('Failed to load image'));
+                img.src = e.target.result;
+            };
 
-                            // Find delimiter
-                            const delimiterIndex = binaryData.indexOf(this.DELIMITER);
-                            if (delimiterIndex === -1) {
-                                reject(new Error('No hidden data found in image'));
-                                return;
-                            }
+            reader.onerror = () => reject(new Error('Failed to read image file'));
+            reader.readAsDataURL(imageFile);
+        });
+    }
+
+    // Number of image rows whose RGB LSBs hold byteCount bytes
+    static rowsForBytes(byteCount, width) {
+        return Math.ceil(Math.ceil(byteCount * 8 / 3) / width);
+    }
+
+    // Draw a decoded image onto a CPU-backed canvas ready for pixel reads
+    static drawToCanvas(img) {
+        const canvas = document.createElement('canvas');
+        const ctx = canvas.getContext('2d', { willReadFrequently: true });
+        canvas.width = img.width;
+        canvas.height = img.height;
+        ctx.drawImage(img, 0, 0);
+        return { canvas, ctx };
+    }
 
-                            // Extract data before delimiter
-                            let extractedData = binaryData.substring(0, delimiterIndex);
+    // Encode data into a decoded image using LSB steganography
+    static async encodeImage(img, data, password = '', onProgress = null) {
+        // Hash the password while the image is drawn; a SHA-256 digest is 32 bytes
+        const passwordHashPromise = password ? this.sha256(password) : null;
+        const dataLength = (password ? 32 : 0) + data.length;
+
+        // Check capacity from the dimensions alone, before any pixel work
+        const bitCount = (this.HEADER_BYTES + dataLength) * 8;
+        const maxCapacity = img.width * img.height * 3; // RGB channels only
+        if (bitCount > maxCapacity) {
+            throw new Error('Image too small for data. Please use a larger image.');
+        }
 
-                            // Handle password
-                            if (password) {
-                                const passwordHash = await this.sha256(password);
-                                const hashLength = passwordHash.length * 8; // Each char = 8 bits
+        // Draw before any await, so the image is copied while the caller still holds it
+        const { canvas, ctx } = this.drawToCanvas(img);
 
-                                if (extractedData.length < hashLength) {
-                                    reject(new Error('Incorrect password or corrupted data'));
-                                    return;
-                                }
+        // Prepare data with password if provided, prefixed by its length,
+        // written straight into one buffer
+        const passwordHash = password ? await passwordHashPromise : new Uint8Array(0);
+        const payload = new Uint8Array(this.HEADER_BYTES + dataLength);
+        new DataView(payload.buffer).setUint32(0, dataLength);
+        payload.set(passwordHash, this.HEADER_BYTES);
+        payload.set(data, this.HEADER_BYTES + passwordHash.length);
 
-                                const storedHashBinary = extractedData.substring(0, hashLength);
-                                const storedHash = this.binaryToText(storedHashBinary);
+        // Get image data for just the band of rows the payload covers
+        const bandRows = this.rowsForBytes(payload.length, canvas.width);
+        const imageData = ctx.getImageData(0, 0, canvas.width, bandRows);
+        const pixels = imageData.data;
 
-                                if (storedHash !== passwordHash) {
-                                    reject(new Error('Incorrect password'));
-                                    return;
-                                }
+        // Embed data using LSB
+        const embedded = await this.runKernel('embed', { pixels, payload }, onProgress);
+        const output = new ImageData(embedded, canvas.width, bandRows);
 
-                                extractedData = extractedData.substring(hashLength);
-                            }
+        // Put the modified band back
+        ctx.putImageData(output, 0, 0);
+
+        // Convert to blob
+        return new Promise((resolve) => canvas.toBlob(resolve, 'image/png'));
+    }
+
+    // Decode data from a decoded image using LSB steganography
+    static async decodeImage(img, password = '', onProgress = null) {
+        // Start hashing the password while the pixels are being read
+        const passwordHashPromise = password ? this.sha256(password) : null;
+
+        // Pixels only need reading once per image; password retries reuse the payload
+        // (and so report no progress of their own). Callers release it with forgetImage.
+        let payload = this.extractedPayloads.get(img);
+        if (!payload) {
+            payload = this.extractPayload(img, onProgress);
+            payload.catch(() => this.extractedPayloads.delete(img));
+            this.extractedPayloads.set(img, payload);
+        }
+        const { data, legacy } = await payload;
+        let extractedData = data;
+
+        // Handle password
+        if (password) {
+            let passwordHash = await passwordHashPromise;
+            if (legacy) {
+                // The old format stored the digest as 64 hex characters
+                passwordHash = this.textToBytes(Array.from(passwordHash, b => b.toString(16).padStart(2, '0')).join(''));
+            }
+            const hashLength = passwordHash.length;
+
+            if (extractedData.length < hashLength) {
+                throw new Error('Incorrect password or corrupted data');
+            }
+
+            const storedHash = extractedData.subarray(0, hashLength);
+
+            if (!this.bytesEqual(storedHash, passwordHash)) {
+                throw new Error('Incorrect password');
+            }
+
+            extractedData = extractedData.subarray(hashLength);
+        }
+
+        // Callers need the format to decode old-format text and file names
+        return { data: extractedData, legacy };
+    }
+
+    // Drop the payload cached for a decoded image by decodeImage
+    static forgetImage(img) {
+        this.extractedPayloads.delete(img);
+    }
+
+    // Read the payload (password hash + data) out of a decoded image, as { data, legacy }
+    static async extractPayload(img, onProgress = null) {
+        const maxBytes = Math.floor(img.width * img.height * 3 / 8);
+        if (maxBytes < this.HEADER_BYTES) {
+            throw new Error('No hidden data found in image');
+        }
+
+        const { canvas, ctx } = this.drawToCanvas(img);
+
+        // Read only the rows holding the length header; an implausible length means the
+        // image predates the header (its data starts with text or a hex password hash)
+        const header = this.readLeadingBytes(ctx, canvas.width, this.HEADER_BYTES);
+        const dataLength = this.bytesToUint32(header, 0);
+        if (dataLength === 0 || this.HEADER_BYTES + dataLength > maxBytes) {
+            return this.extractLegacyPayload(ctx, canvas, onProgress);
+        }
+
+        const legacyFile = this.readLegacyFilePayload(ctx, canvas.width, dataLength, maxBytes);
+        if (legacyFile) {
+            return { data: legacyFile, legacy: true };
+        }
+
+        // Then read exactly the rows holding the payload
+        const extracted = await this.readPayload(ctx, canvas.width, this.HEADER_BYTES + dataLength, onProgress);
+        return { data: extracted.subarray(this.HEADER_BYTES), legacy: false };
+    }
+
+    // Read the first byteCount payload bytes from only the rows that hold them
+    static readLeadingBytes(ctx, width, byteCount) {
+        const rows = this.rowsForBytes(byteCount, width);
+        const pixels = ctx.getImageData(0, 0, width, rows).data;
+        return this.extractBytes(pixels, new Uint8Array(byteCount));
+    }
+
+    // Same as readLeadingBytes, but through the worker with progress reports
+    static readPayload(ctx, width, byteCount, onProgress) {
+        const rows = this.rowsForBytes(byteCount, width);
+        const pixels = ctx.getImageData(0, 0, width, rows).data;
+        return this.runKernel('extract', { pixels, byteCount }, onProgress);
+    }
+
+    // An old-format file without a password starts with its 32-bit file name length, which
+    // also reads as a plausible length header; it is told apart by the old delimiter sitting
+    // byte-aligned right after the file data. Returns the file record, or null.
+    static readLegacyFilePayload(ctx, width, nameLength, maxBytes) {
+        const sizeEnd = 4 + nameLength + 4;
+        if (nameLength >= 256 || sizeEnd > maxBytes) return null;
+
+        const fileSize = this.bytesToUint32(this.readLeadingBytes(ctx, width, sizeEnd), sizeEnd - 4);
+        const end = sizeEnd + fileSize + 2;
+        if (end > maxBytes) return null;
+
+        const bytes = this.readLeadingBytes(ctx, width, end);
+        if (((bytes[end - 2] << 8) | bytes[end - 1]) !== this.LEGACY_DELIMITER) return null;
+        return bytes.subarray(0, end - 2);
+    }
+
+    // Read an image written by the old encoder: data bits up to the first delimiter.
+    // Without a length header any image has a delimiter somewhere in its noise, so the
+    // LSBs are scanned band by band and the scan gives up as soon as the data stops
+    // looking like what the old encoder wrote: a hex password hash, then anything, or text.
+    static async extractLegacyPayload(ctx, canvas, onProgress) {
+        const width = canvas.width;
+        const bandRows = this.rowsForBytes(this.WORKER_CHUNK_BYTES, width);
+        let window = 0;
+        let byte = 0;
+        let bit = 0;
+        let byteCount = 0;
+        let hexPrefix = true; // every byte so far is a hex digit
+        let pendingFF = false; // last byte was 0xFF, which may start the delimiter
+        let recent = 0; // last three bytes, oldest in bits 16-23
+        let repeatRun = 0; // consecutive bytes equal to the byte three before them
+        let dataBits = -1;
+
+        scan:
+        for (let y = 0; y < canvas.height; y += bandRows) {
+            const pixels = ctx.getImageData(0, y, width, Math.min(bandRows, canvas.height - y)).data;
+            for (let i = 0; i < pixels.length; i += 4) {
+                for (let j = 0; j < 3; j++) {
+                    const b = pixels[i + j] & 1;
+                    window = ((window << 1) | b) & 0xFFFF;
+                    bit++;
+                    if (window === this.LEGACY_DELIMITER) {
+                        dataBits = bit - 16;
+                        break scan;
+                    }
 
-                            resolve(extractedData);
+                    byte = (byte << 1) | b;
+                    if ((bit & 7) !== 0) continue;
 
-                        } catch (err) {
-                            reject(err);
+                    // Past a complete hex hash any bytes may follow; before that only text
+                    if (!hexPrefix || byteCount < 64) {
+                        if (pendingFF) {
+                            throw new Error('No hidden data found in image');
                         }
-                    };
-                    img.src = e.target.result;
-                };
+                        hexPrefix = hexPrefix && this.isHexDigitByte(byte);
+                        pendingFF = byte === 0xFF;
+                        if (!pendingFF && !this.isLegacyTextByte(byte)) {
+                            throw new Error('No hidden data found in image');
+                        }
+
+                        // Flat image areas repeat every 8 pixels, i.e. every 3 bytes, and can
+                        // read as valid text for the whole image; real messages don't
+                        repeatRun = byte === (recent >>> 16) ? repeatRun + 1 : 0;
+                        if (repeatRun >= 256) {
+                            throw new Error('No hidden data found in image');
+                        }
+                        recent = ((recent << 8) | byte) & 0xFFFFFF;
+                    }
+                    byteCount++;
+                    byte = 0;
+                }
+            }
+        }
 
-                reader.onerror = () => reject(new Error('Failed to read image file'));
-                reader.readAsDataURL(imageFile);
+        if (dataBits <= 0 || dataBits % 8 !== 0) {
+            throw new Error('No hidden data found in image');
+        }
 
-            } catch (err) {
-                reject(err);
+        const data = await this.readPayload(ctx, width, dataBits >> 3, onProgress);
+        if (!this.isLegacyData(data)) {
+            throw new Error('No hidden data found in image');
+        }
+        return { data, legacy: true };
+    }
+
+    // Whether old-format data starts with a hex password hash, or is a file record or plain text
+    static isLegacyData(data) {
+        if (data.length >= 64 && data.subarray(0, 64).every(this.isHexDigitByte)) return true;
+
+        if (data.length >= 8) {
+            const nameLength = this.bytesToUint32(data, 0);
+            if (nameLength > 0 && nameLength < 256 && 8 + nameLength <= data.length &&
+                8 + nameLength + this.bytesToUint32(data, 4 + nameLength) === data.length) {
+                return true;
             }
-        });
+        }
+
+        return data.length > 0 && data.every(this.isLegacyTextByte);
     }
 
-    // Convert file to binary with metadata
-    static async fileToBinary(file) {
+    // Whether a byte is a lowercase hex digit, as in the old format's password hash
+    static isHexDigitByte(b) {
+        return (b >= 0x30 && b <= 0x39) || (b >= 0x61 && b <= 0x66);
+    }
+
+    // Whether a byte can be a character of old-format text, which was written one Latin-1
+    // byte per character. 0xFF (ÿ) is excluded: it is what a white image's LSBs read as.
+    static isLegacyTextByte(b) {
+        return (b >= 0x20 && b < 0x7F) || b === 0x09 || b === 0x0A || b === 0x0D || (b >= 0xA0 && b < 0xFF);
+    }
+
+    // Decode 4 big-endian bytes starting at offset
+    static bytesToUint32(bytes, offset = 0) {
+        return ((bytes[offset] << 24) | (bytes[offset + 1] << 16) | (bytes[offset + 2] << 8) | bytes[offset + 3]) >>> 0;
+    }
+
+    // Convert file to bytes with metadata
+    static async fileToBytes(file) {
         return new Promise((resolve, reject) => {
             const reader = new FileReader();
             
             reader.onload = (e) => {
                 try {
-                    const arrayBuffer = e.target.result;
-                    const bytes = new Uint8Array(arrayBuffer);
-                    
-                    // Convert bytes to binary
-                    let fileBinary = '';
-                    for (let i = 0; i < bytes.length; i++) {
-                        fileBinary += bytes[i].toString(2).padStart(8, '0');
-                    }
+                    const fileBytes = new Uint8Array(e.target.result);
 
                     // Create metadata: filename length (32 bits) + filename + file size (32 bits) + data
                     const filename = file.name;
-                    const filenameBinary = this.textToBinary(filename);
-                    const filenameLength = filename.length;
-                    const fileSize = bytes.length;
-
-                    // Convert lengths to 32-bit binary
-                    const filenameLengthBinary = filenameLength.toString(2).padStart(32, '0');
-                    const fileSizeBinary = fileSize.toString(2).padStart(32, '0');
-
-                    // Combine: length(32) + filename + size(32) + data
-                    const fullBinary = filenameLengthBinary + filenameBinary + fileSizeBinary + fileBinary;
+                    const filenameBytes = this.textToBytes(filename);
+                    const fileSize = fileBytes.length;
+
+                    // Combine into one buffer: length(32) + filename + size(32) + data
+                    const sizeOffset = 4 + filenameBytes.length;
+                    const fullBytes = new Uint8Array(sizeOffset + 4 + fileSize);
+                    const view = new DataView(fullBytes.buffer);
+                    view.setUint32(0, filenameBytes.length);
+                    fullBytes.set(filenameBytes, 4);
+                    view.setUint32(sizeOffset, fileSize);
+                    fullBytes.set(fileBytes, sizeOffset + 4);
 
                     resolve({
-                        binary: fullBinary,
+                        bytes: fullBytes,
                         filename: filename,
                         size: fileSize
                     });
@@ -235,39 +556,32 @@ class SteganographyEngine {
         });
     }
 
-    // Extract file from binary with metadata
-    static binaryToFile(binary) {
-        try {
-            // Extract filename length (first 32 bits)
-            const filenameLengthBinary = binary.substring(0, 32);
-            const filenameLength = parseInt(filenameLengthBinary, 2);
-
-            // Extract filename
-            const filenameBinary = binary.substring(32, 32 + filenameLength * 8);
-            const filename = this.binaryToText(filenameBinary);
-
-            // Extract file size (next 32 bits)
-            const fileSizeBinary = binary.substring(32 + filenameLength * 8, 64 + filenameLength * 8);
-            const fileSize = parseInt(fileSizeBinary, 2);
-
-            // Extract file data
-            const fileBinary = binary.substring(64 + filenameLength * 8, 64 + filenameLength * 8 + fileSize * 8);
-
-            // Convert binary to bytes
-            const bytes = new Uint8Array(fileSize);
-            for (let i = 0; i < fileSize; i++) {
-                const byteBinary = fileBinary.substring(i * 8, i * 8 + 8);
-                bytes[i] = parseInt(byteBinary, 2);
-            }
+    // Extract file from bytes with metadata
+    static bytesToFile(bytes, legacy = false) {
+        // Extract filename length (first 32 bits)
+        const filenameLength = this.bytesToUint32(bytes, 0);
+        const sizeOffset = 4 + filenameLength;
+        const dataOffset = sizeOffset + 4;
+        if (dataOffset > bytes.length) {
+            throw new Error('Failed to extract file from binary data');
+        }
 
-            return {
-                filename: filename,
-                size: fileSize,
-                data: bytes
-            };
-        } catch (err) {
+        // Extract filename
+        const filename = this.bytesToText(bytes.subarray(4, sizeOffset), legacy);
+
+        // Extract file size (next 32 bits)
+        const fileSize = this.bytesToUint32(bytes, sizeOffset);
+        if (dataOffset + fileSize > bytes.length) {
             throw new Error('Failed to extract file from binary data');
         }
+
+        // A Blob lets the browser hold the contents outside the JS heap and hand
+        // them straight to a download without another copy
+        return {
+            filename: filename,
+            size: fileSize,
+            blob: new Blob([bytes.subarray(dataOffset, dataOffset + fileSize)])
+        };
     }
 }
 
@@ -275,6 +589,43 @@ class SteganographyEngine {
 // UI CONTROLLER
 // ==========================================
 
+// Static info-panel markup, built once instead of on every update
+const DECODE_DETECTION_READY_HTML = `
+    <p class="info-placeholder">🔍 Analysis Ready</p>
+    <div class="info-details">
+        <p><strong>Status:</strong> <span style="color: var(--info)">Ready to extract</span></p>
+        <p><strong>Detection:</strong> LSB steganography compatible</p>
+        <p><strong>Recommendation:</strong> Enter password if used during encoding</p>
+    </div>
+`;
+
+const DECODE_STATUS_READY_HTML = `
+    <p class="status-ready">✅ Ready to decode</p>
+    <p class="info-text">Click 'Decode Data' to extract hidden information</p>
+`;
+
+// Preview object URLs kept alive for recently selected images
+const PREVIEW_URL_CACHE_SIZE = 8;
+
+// Longest decoded message rendered into the results textarea
+const DECODED_TEXT_PREVIEW_CHARS = 100000;
+
+const ENCODE_DATA_INFO_HTML = `
+    <p class="info-placeholder">✅ Data Ready</p>
+    <div class="info-details">
+        <p><strong>Type:</strong> <span data-field="type"></span></p>
+        <p data-field="name-row"><strong>Name:</strong> <span data-field="name"></span></p>
+        <p><strong>Size:</strong> <span data-field="size"></span></p>
+        <p><strong>Encryption:</strong> <span data-field="encryption"></span></p>
+        <p><strong>Feasibility:</strong> <span style="color: var(--success)">Ready to encode</span></p>
+    </div>
+`;
+
+const ENCODE_STATUS_READY_HTML = `
+    <p class="status-ready">✅ All set!</p>
+    <p class="info-text">Ready to encode. Click 'Encode Data' to proceed.</p>
+`;
+
 class UIController {
     constructor() {
         this.currentPage = 'encode';
@@ -282,20 +633,114 @@ class UIController {
         this.decodeImage = null;
         this.secretFile = null;
         this.decodedFileData = null;
+        this.decodedText = null;
+        this.imageCache = new Map(); // file key -> Promise of decoded image
+        this.renderedHTML = new WeakMap(); // element -> markup last written to it
+        this.dataInfoFrame = null;
+        this.elements = new Map(); // id -> element, so handlers skip repeated DOM lookups
+        this.previewUrls = new Map(); // file key -> object URL, least recently used first
         
         this.init();
     }
 
+    // Identify a file by name, size and modification time
+    fileKey(file) {
+        return `${file.name}:${file.size}:${file.lastModified}`;
+    }
+
+    // Decode an image file once and reuse it for every later operation on it
+    getDecodedImage(file) {
+        const key = this.fileKey(file);
+        let image = this.imageCache.get(key);
+        if (!image) {
+            image = SteganographyEngine.loadImage(file);
+            image.catch(() => this.imageCache.delete(key));
+            this.imageCache.set(key, image);
+
+            // Only the current cover and decode images are worth keeping
+            if (this.imageCache.size > 4) {
+                const stale = [...this.imageCache.keys()].find(k => !this.isImageInUse(k));
+                this.releaseDecodedImage(stale);
+            }
+        }
+        return image;
+    }
+
+    // Whether a file key belongs to the selected cover or decode image
+    isImageInUse(key) {
+        return [this.coverImage, this.decodeImage].some(file => file && this.fileKey(file) === key);
+    }
+
+    // Drop a cached decode along with the payload the engine extracted from it, and
+    // free the bitmap's pixel memory now rather than whenever it is collected
+    releaseDecodedImage(key) {
+        const image = this.imageCache.get(key);
+        if (!image) return;
+
+        this.imageCache.delete(key);
+        image.then((img) => {
+            SteganographyEngine.forgetImage(img);
+            if (typeof ImageBitmap !== 'undefined' && img instanceof ImageBitmap) img.close();
+        }, () => {});
+    }
+
+    // Forget a removed image unless it is still selected on the other page
+    releaseRemovedImage(file) {
+        const key = this.fileKey(file);
+        if (!this.isImageInUse(key)) this.releaseDecodedImage(key);
+    }
+
     init() {
+        this.captureDefaultPanels();
         this.setupNavigation();
         this.setupEncodeTab();
         this.setupDecodeTab();
     }
 
+    // Remember the placeholder markup index.html ships for each info panel, so it has
+    // a single source and can be restored without re-declaring it here
+    captureDefaultPanels() {
+        this.defaultPanelHTML = new Map();
+        ['encode-image-info', 'decode-image-info', 'decode-detection', 'decode-status'].forEach(id => {
+            const element = this.byId(id);
+            this.defaultPanelHTML.set(id, element.innerHTML);
+            this.renderedHTML.set(element, element.innerHTML);
+        });
+    }
+
+    // Put info panels back to their placeholder markup
+    resetPanels(...ids) {
+        ids.forEach(id => this.setHTML(this.byId(id), this.defaultPanelHTML.get(id)));
+    }
+
+    // Look up an element by id once and reuse it afterwards
+    byId(id) {
+        let element = this.elements.get(id);
+        if (!element) {
+            element = document.getElementById(id);
+            this.elements.set(id, element);
+        }
+        return element;
+    }
+
+    // Replace an element's markup, skipping the re-parse when it is unchanged
+    setHTML(element, html) {
+        if (this.renderedHTML.get(element) === html) return;
+        element.innerHTML = html;
+        this.renderedHTML.set(element, html);
+    }
+
+    // Update an element's text only when it differs
+    setText(element, text) {
+        if (element.textContent !== text) element.textContent = text;
+    }
+
     // Navigation
     setupNavigation() {
-        const navItems = document.querySelectorAll('.nav-item');
-        navItems.forEach(item => {
+        // Looked up once; switchPage reuses them on every navigation
+        this.navItemsByPage = new Map();
+        document.querySelectorAll('.nav-item').forEach(item => {
+            this.navItemsByPage.set(item.dataset.page, item);
             item.addEventListener('click', () => {
                 const page = item.dataset.page;
                 this.switchPage(page);
@@ -304,19 +749,14 @@ class UIController {
     }
 
     switchPage(page) {
-        // Update nav items
-        document.querySelectorAll('.nav-item').forEach(item => {
-            item.classList.remove('active');
-            if (item.dataset.page === page) {
-                item.classList.add('active');
-            }
-        });
+        if (page === this.currentPage) return;
 
-        // Update pages
-        document.querySelectorAll('.page').forEach(p => {
-            p.classList.remove('active');
-        });
-        document.getElementById(`${page}-page`).classList.add('active');
+        // Only the outgoing and incoming nav item and page change
+        this.navItemsByPage.get(this.currentPage).classList.remove('active');
+        this.navItemsByPage.get(page).classList.add('active');
+
+        this.byId(`${this.currentPage}-page`).classList.remove('active');
+        this.byId(`${page}-page`).classList.add('active');
 
         this.currentPage = page;
     }
@@ -324,8 +764,8 @@ class UIController {
     // Setup Encode Tab
     setupEncodeTab() {
         // Cover image upload
-        const uploadZone = document.getElementById('encode-upload-zone');
-        const imageInput = document.getElementById('cover-image-input');
+        const uploadZone = this.byId('encode-upload-zone');
+        const imageInput = this.byId('cover-image-input');
         
         uploadZone.addEventListener('click', () => imageInput.click());
         imageInput.addEventListener('change', (e) => this.handleCoverImageSelect(e.target.files[0]));
@@ -347,53 +787,70 @@ class UIController {
         });
 
         // Remove cover image
-        document.getElementById('remove-cover').addEventListener('click', () => {
+        this.byId('remove-cover').addEventListener('click', () => {
+            const file = this.coverImage;
             this.coverImage = null;
-            document.getElementById('encode-upload-zone').style.display = 'block';
-            document.getElementById('cover-preview').style.display = 'none';
+            if (file) this.releaseRemovedImage(file);
+            this.clearPreview(this.byId('cover-preview-img'));
+            this.byId('encode-upload-zone').style.display = 'block';
+            this.byId('cover-preview').style.display = 'none';
+            this.resetPanels('encode-image-info');
         });
 
         // Data type radio buttons
-        const radioButtons = document.querySelectorAll('input[name="data-type"]');
-        radioButtons.forEach(radio => {
+        this.dataTypeRadios = document.querySelectorAll('input[name="data-type"]');
+        this.dataTypeRadios.forEach(radio => {
             radio.addEventListener('change', () => this.toggleDataInput());
         });
 
         // File input
-        const fileSelectZone = document.getElementById('file-select-zone');
-        const secretFileInput = document.getElementById('secret-file-input');
+        const fileSelectZone = this.byId('file-select-zone');
+        const secretFileInput = this.byId('secret-file-input');
         
         fileSelectZone.addEventListener('click', () => secretFileInput.click());
         secretFileInput.addEventListener('change', (e) => this.handleSecretFileSelect(e.target.files[0]));
 
         // Encode button
-        document.getElementById('encode-btn').addEventListener('click', () => this.handleEncode());
+        this.byId('encode-btn').addEventListener('click', () => this.handleEncode());
 
-        // Monitor text input for real-time updates
-        document.getElementById('secret-text').addEventListener('input', (e) => {
-            const text = e.target.value.trim();
-            if (text) {
-                this.updateEncodeDataInfo(text.length, 'text');
-            }
-        });
+        // Monitor text and password input for real-time updates, at most once per frame
+        this.byId('secret-text').addEventListener('input', () => this.scheduleEncodeDataInfo());
+        this.byId('encode-password').addEventListener('input', () => this.scheduleEncodeDataInfo());
+    }
 
-        // Monitor password input for encryption status updates
-        document.getElementById('encode-password').addEventListener('input', () => {
-            const dataType = document.querySelector('input[name="data-type"]:checked').value;
-            if (dataType === 'text') {
-                const text = document.getElementById('secret-text').value.trim();
-                if (text) this.updateEncodeDataInfo(text.length, 'text');
-            } else if (this.secretFile) {
-                this.updateEncodeDataInfo(this.secretFile.size, 'file', this.secretFile.name);
-            }
+    // Coalesce bursts of input events into a single data info refresh on the next frame
+    scheduleEncodeDataInfo() {
+        if (this.dataInfoFrame) return;
+        this.dataInfoFrame = requestAnimationFrame(() => {
+            this.dataInfoFrame = null;
+            this.refreshEncodeDataInfo();
         });
     }
 
+    // Value of the checked data type radio button
+    selectedDataType() {
+        for (const radio of this.dataTypeRadios) {
+            if (radio.checked) return radio.value;
+        }
+        return null;
+    }
+
+    // Refresh the data info panel from the current text or file selection
+    refreshEncodeDataInfo() {
+        const dataType = this.selectedDataType();
+        if (dataType === 'text') {
+            const text = this.byId('secret-text').value.trim();
+            if (text) this.updateEncodeDataInfo(text.length, 'text');
+        } else if (this.secretFile) {
+            this.updateEncodeDataInfo(this.secretFile.size, 'file', this.secretFile.name);
+        }
+    }
+
     // Setup Decode Tab
     setupDecodeTab() {
         // Decode image upload
-        const uploadZone = document.getElementById('decode-upload-zone');
-        const imageInput = document.getElementById('decode-image-input');
+        const uploadZone = this.byId('decode-upload-zone');
+        const imageInput = this.byId('decode-image-input');
         
         uploadZone.addEventListener('click', () => imageInput.click());
         imageInput.addEventListener('change', (e) => this.handleDecodeImageSelect(e.target.files[0]));
@@ -415,19 +872,23 @@ class UIController {
         });
 
         // Remove decode image
-        document.getElementById('remove-decode').addEventListener('click', () => {
+        this.byId('remove-decode').addEventListener('click', () => {
+            const file = this.decodeImage;
             this.decodeImage = null;
-            document.getElementById('decode-upload-zone').style.display = 'block';
-            document.getElementById('decode-preview').style.display = 'none';
-            document.getElementById('results-card').style.display = 'none';
+            if (file) this.releaseRemovedImage(file);
+            this.clearPreview(this.byId('decode-preview-img'));
+            this.byId('decode-upload-zone').style.display = 'block';
+            this.byId('decode-preview').style.display = 'none';
+            this.clearDecodedResults();
+            this.resetPanels('decode-image-info', 'decode-detection', 'decode-status');
         });
 
         // Decode button
-        document.getElementById('decode-btn').addEventListener('click', () => this.handleDecode());
+        this.byId('decode-btn').addEventListener('click', () => this.handleDecode());
 
         // Copy and download buttons
-        document.getElementById('copy-text-btn').addEventListener('click', () => this.copyDecodedText());
-        document.getElementById('download-file-btn').addEventListener('click', () => this.downloadDecodedFile());
+        this.byId('copy-text-btn').addEventListener('click', () => this.copyDecodedText());
+        this.byId('download-file-btn').addEventListener('click', () => this.downloadDecodedFile());
     }
 
     // Handle cover image selection
@@ -440,48 +901,85 @@ class UIController {
         this.coverImage = file;
         
         // Show preview
-        const reader = new FileReader();
-        reader.onload = (e) => {
-            document.getElementById('encode-upload-zone').style.display = 'none';
-            document.getElementById('cover-preview').style.display = 'flex';
-            document.getElementById('cover-preview-img').src = e.target.result;
-
-            // Create image to get dimensions
-            const img = new Image();
-            img.onload = () => {
-                const capacity = (img.width * img.height * 3) / 8; // bytes
-                const capacityKB = (capacity / 1024).toFixed(2);
-                const fileSizeMB = (file.size / 1024 / 1024).toFixed(2);
-                
-                document.getElementById('cover-info').textContent = 
-                    `${img.width}×${img.height} pixels | Capacity: ~${capacityKB} KB`;
-                
-                // Update info panel
-                this.updateEncodeImageInfo(file, img, capacity);
-            };
-            img.src = e.target.result;
-        };
-        reader.readAsDataURL(file);
+        this.byId('encode-upload-zone').style.display = 'none';
+        this.byId('cover-preview').style.display = 'flex';
+        this.showPreview(this.byId('cover-preview-img'), file);
+
+        // Get dimensions from the shared decoded image, which the encode step then reuses
+        this.getDecodedImage(file).then((img) => {
+            if (this.coverImage !== file) return; // another image was picked meanwhile
+
+            const capacity = this.imageCapacity(img);
+            const capacityKB = (capacity / 1024).toFixed(2);
+            
+            this.byId('cover-info').textContent = 
+                `${img.width}×${img.height} pixels | Capacity: ~${capacityKB} KB`;
+            
+            // Update info panel
+            this.updateEncodeImageInfo(file, img, capacity);
+        }).catch(() => this.showToast('Failed to load image', 'error'));
+    }
+
+    // Point a preview image at a file through a memoized object URL, so reselecting
+    // a recent file hits the browser's decoded-image cache instead of decoding again
+    showPreview(imgElement, file) {
+        const key = this.fileKey(file);
+        let url = this.previewUrls.get(key);
+        if (url) {
+            this.previewUrls.delete(key); // re-insert below as most recently used
+        } else {
+            url = URL.createObjectURL(file);
+            if (this.previewUrls.size >= PREVIEW_URL_CACHE_SIZE) {
+                // The other page's preview may still be showing the oldest URL
+                const staleKey = [...this.previewUrls.keys()].find(k => !this.isImageInUse(k));
+                URL.revokeObjectURL(this.previewUrls.get(staleKey));
+                this.previewUrls.delete(staleKey);
+            }
+        }
+        this.previewUrls.set(key, url);
+        imgElement.src = url;
+    }
+
+    // Drop a preview image's source
+    clearPreview(imgElement) {
+        imgElement.removeAttribute('src');
+    }
+
+    // Bytes an image can hide: one bit in each RGB channel of every pixel
+    imageCapacity(img) {
+        return (img.width * img.height * 3) / 8;
+    }
+
+    // Detail rows shared by the encode and decode image info panels; the file name is
+    // filled in afterwards by fillImageDetails so it is never parsed as markup
+    imageDetailsHTML(file, img) {
+        const fileSizeMB = (file.size / 1024 / 1024).toFixed(2);
+        return `
+                <p><strong>Filename:</strong> <span data-field="filename"></span></p>
+                <p><strong>Dimensions:</strong> ${img.width} × ${img.height} px</p>
+                <p><strong>File Size:</strong> ${fileSizeMB} MB</p>
+                <p><strong>Format:</strong> ${file.type.split('/')[1].toUpperCase()}</p>`;
+    }
+
+    // Fill the user-supplied file name into a panel rendered from imageDetailsHTML
+    fillImageDetails(infoBox, file) {
+        this.setText(infoBox.querySelector('[data-field="filename"]'), file.name);
     }
 
     // Update encode image info panel
     updateEncodeImageInfo(file, img, capacity) {
-        const fileSizeMB = (file.size / 1024 / 1024).toFixed(2);
         const capacityKB = (capacity / 1024).toFixed(2);
         const capacityMB = (capacity / 1024 / 1024).toFixed(2);
         
-        const infoBox = document.getElementById('encode-image-info');
-        infoBox.innerHTML = `
+        const infoBox = this.byId('encode-image-info');
+        this.setHTML(infoBox, `
             <p class="info-placeholder">✅ Image Selected</p>
-            <div class="info-details">
-                <p><strong>Filename:</strong> ${file.name}</p>
-                <p><strong>Dimensions:</strong> ${img.width} × ${img.height} px</p>
-                <p><strong>File Size:</strong> ${fileSizeMB} MB</p>
-                <p><strong>Format:</strong> ${file.type.split('/')[1].toUpperCase()}</p>
+            <div class="info-details">${this.imageDetailsHTML(file, img)}
                 <p><strong>Max Capacity:</strong> ~${capacityKB} KB (${capacityMB} MB)</p>
                 <p><strong>Quality:</strong> <span style="color: var(--success)">Excellent</span></p>
             </div>
-        `;
+        `);
+        this.fillImageDetails(infoBox, file);
     }
 
     // Handle decode image selection
@@ -494,62 +992,41 @@ class UIController {
         this.decodeImage = file;
         
         // Show preview
-        const reader = new FileReader();
-        reader.onload = (e) => {
-            document.getElementById('decode-upload-zone').style.display = 'none';
-            document.getElementById('decode-preview').style.display = 'flex';
-            document.getElementById('decode-preview-img').src = e.target.result;
-
-            // Create image to get dimensions
-            const img = new Image();
-            img.onload = () => {
-                const sizeKB = (file.size / 1024).toFixed(2);
-                document.getElementById('decode-info').textContent = 
-                    `${img.width}×${img.height} pixels | ${sizeKB} KB`;
-                
-                // Update info panel
-                this.updateDecodeImageInfo(file, img);
-            };
-            img.src = e.target.result;
-        };
-        reader.readAsDataURL(file);
+        this.byId('decode-upload-zone').style.display = 'none';
+        this.byId('decode-preview').style.display = 'flex';
+        this.showPreview(this.byId('decode-preview-img'), file);
+
+        // Get dimensions from the shared decoded image, which the decode step then reuses
+        this.getDecodedImage(file).then((img) => {
+            if (this.decodeImage !== file) return; // another image was picked meanwhile
+
+            const sizeKB = (file.size / 1024).toFixed(2);
+            this.byId('decode-info').textContent = 
+                `${img.width}×${img.height} pixels | ${sizeKB} KB`;
+            
+            // Update info panel
+            this.updateDecodeImageInfo(file, img);
+        }).catch(() => this.showToast('Failed to load image', 'error'));
     }
 
     // Update decode image info panel
     updateDecodeImageInfo(file, img) {
-        const fileSizeMB = (file.size / 1024 / 1024).toFixed(2);
-        const capacity = (img.width * img.height * 3) / 8;
-        const capacityKB = (capacity / 1024).toFixed(2);
+        const capacityKB = (this.imageCapacity(img) / 1024).toFixed(2);
         
-        const infoBox = document.getElementById('decode-image-info');
-        infoBox.innerHTML = `
+        const infoBox = this.byId('decode-image-info');
+        this.setHTML(infoBox, `
             <p class="info-placeholder">✅ Image Uploaded</p>
-            <div class="info-details">
-                <p><strong>Filename:</strong> ${file.name}</p>
-                <p><strong>Dimensions:</strong> ${img.width} × ${img.height} px</p>
-                <p><strong>File Size:</strong> ${fileSizeMB} MB</p>
-                <p><strong>Format:</strong> ${file.type.split('/')[1].toUpperCase()}</p>
+            <div class="info-details">${this.imageDetailsHTML(file, img)}
                 <p><strong>Potential Capacity:</strong> ~${capacityKB} KB</p>
             </div>
-        `;
+        `);
+        this.fillImageDetails(infoBox, file);
         
         // Update detection status
-        const detectionBox = document.getElementById('decode-detection');
-        detectionBox.innerHTML = `
-            <p class="info-placeholder">🔍 Analysis Ready</p>
-            <div class="info-details">
-                <p><strong>Status:</strong> <span style="color: var(--info)">Ready to extract</span></p>
-                <p><strong>Detection:</strong> LSB steganography compatible</p>
-                <p><strong>Recommendation:</strong> Enter password if used during encoding</p>
-            </div>
-        `;
+        this.setHTML(this.byId('decode-detection'), DECODE_DETECTION_READY_HTML);
         
         // Update status
-        const statusBox = document.getElementById('decode-status');
-        statusBox.innerHTML = `
-            <p class="status-ready">✅ Ready to decode</p>
-            <p class="info-text">Click 'Decode Data' to extract hidden information</p>
-        `;
+        this.setHTML(this.byId('decode-status'), DECODE_STATUS_READY_HTML);
     }
 
     // Handle secret file selection
@@ -558,8 +1035,8 @@ class UIController {
 
         this.secretFile = file;
         const sizeKB = (file.size / 1024).toFixed(2);
-        document.getElementById('secret-file-info').style.display = 'block';
-        document.getElementById('secret-file-info').textContent = 
+        this.byId('secret-file-info').style.display = 'block';
+        this.byId('secret-file-info').textContent = 
             `✅ ${file.name} (${sizeKB} KB)`;
         
         // Update data info panel
@@ -569,43 +1046,39 @@ class UIController {
     // Update encode data info panel
     updateEncodeDataInfo(dataSize, type, extraInfo = '') {
         const sizeKB = (dataSize / 1024).toFixed(2);
-        const password = document.getElementById('encode-password').value;
+        const password = this.byId('encode-password').value;
         const hasPassword = password.length > 0;
         const typeText = type === 'text' ? 'Text Message' : 'File';
         const encryptColor = hasPassword ? 'var(--success)' : 'var(--warning)';
         const encryptText = hasPassword ? 'Enabled (SHA-256)' : 'Disabled';
-        const nameRow = extraInfo ? `<p><strong>Name:</strong> ${extraInfo}</p>` : '';
-        
-        const dataBox = document.getElementById('encode-data-info');
-        dataBox.innerHTML = `
-            <p class="info-placeholder">✅ Data Ready</p>
-            <div class="info-details">
-                <p><strong>Type:</strong> ${typeText}</p>
-                ${nameRow}
-                <p><strong>Size:</strong> ${dataSize} bytes (~${sizeKB} KB)</p>
-                <p><strong>Encryption:</strong> <span style="color: ${encryptColor}">${encryptText}</span></p>
-                <p><strong>Feasibility:</strong> <span style="color: var(--success)">Ready to encode</span></p>
-            </div>
-        `;
+
+        // Build the panel once, then only touch the fields that change
+        const dataBox = this.byId('encode-data-info');
+        this.setHTML(dataBox, ENCODE_DATA_INFO_HTML);
+        const field = (name) => dataBox.querySelector(`[data-field="${name}"]`);
+
+        this.setText(field('type'), typeText);
+        field('name-row').hidden = !extraInfo;
+        this.setText(field('name'), extraInfo);
+        this.setText(field('size'), `${dataSize} bytes (~${sizeKB} KB)`);
+        const encryption = field('encryption');
+        this.setText(encryption, encryptText);
+        encryption.style.color = encryptColor;
         
         // Update status
-        const statusBox = document.getElementById('encode-status');
-        statusBox.innerHTML = `
-            <p class="status-ready">✅ All set!</p>
-            <p class="info-text">Ready to encode. Click 'Encode Data' to proceed.</p>
-        `;
+        this.setHTML(this.byId('encode-status'), ENCODE_STATUS_READY_HTML);
     }
 
     // Toggle between text and file input
     toggleDataInput() {
-        const dataType = document.querySelector('input[name="data-type"]:checked').value;
+        const dataType = this.selectedDataType();
         
         if (dataType === 'text') {
-            document.getElementById('text-input-container').style.display = 'block';
-            document.getElementById('file-input-container').style.display = 'none';
+            this.byId('text-input-container').style.display = 'block';
+            this.byId('file-input-container').style.display = 'none';
         } else {
-            document.getElementById('text-input-container').style.display = 'none';
-            document.getElementById('file-input-container').style.display = 'block';
+            this.byId('text-input-container').style.display = 'none';
+            this.byId('file-input-container').style.display = 'block';
         }
     }
 
@@ -618,35 +1091,41 @@ class UIController {
                 return;
             }
 
-            const dataType = document.querySelector('input[name="data-type"]:checked').value;
-            const password = document.getElementById('encode-password').value;
+            // Start decoding the cover image while the secret data is prepared
+            const coverImgPromise = this.getDecodedImage(this.coverImage);
+
+            const dataType = this.selectedDataType();
+            const password = this.byId('encode-password').value;
 
-            let binaryData;
+            let data;
 
             if (dataType === 'text') {
-                const text = document.getElementById('secret-text').value.trim();
+                const text = this.byId('secret-text').value.trim();
                 if (!text) {
                     this.showToast('Please enter a message to hide', 'error');
                     return;
                 }
-                binaryData = SteganographyEngine.textToBinary(text);
+                data = SteganographyEngine.textToBytes(text);
             } else {
                 if (!this.secretFile) {
                     this.showToast('Please select a file to hide', 'error');
                     return;
                 }
-                const fileData = await SteganographyEngine.fileToBinary(this.secretFile);
-                binaryData = fileData.binary;
+                const fileData = await SteganographyEngine.fileToBytes(this.secretFile);
+                data = fileData.bytes;
             }
 
             // Show progress
-            const encodeBtn = document.getElementById('encode-btn');
-            const progress = document.getElementById('encode-progress');
+            const encodeBtn = this.byId('encode-btn');
+            const progress = this.byId('encode-progress');
             encodeBtn.disabled = true;
-            progress.style.display = 'block';
+            this.showProgress(progress);
 
             // Encode
-            const encodedBlob = await SteganographyEngine.encodeImage(this.coverImage, binaryData, password);
+            const coverImg = await coverImgPromise;
+            const encodedBlob = await SteganographyEngine.encodeImage(
+                coverImg, data, password, (fraction) => this.updateProgress(progress, fraction)
+            );
 
             // Download
             const url = URL.createObjectURL(encodedBlob);
@@ -663,42 +1142,52 @@ class UIController {
             progress.style.display = 'none';
 
         } catch (err) {
-            document.getElementById('encode-btn').disabled = false;
-            document.getElementById('encode-progress').style.display = 'none';
+            this.byId('encode-btn').disabled = false;
+            this.byId('encode-progress').style.display = 'none';
             this.showToast(err.message, 'error');
         }
     }
 
     // Handle decoding
     async handleDecode() {
+        const file = this.decodeImage;
         try {
             // Validation
-            if (!this.decodeImage) {
+            if (!file) {
                 this.showToast('Please select an image to decode', 'error');
                 return;
             }
 
-            const password = document.getElementById('decode-password').value;
+            const password = this.byId('decode-password').value;
 
             // Show progress
-            const decodeBtn = document.getElementById('decode-btn');
-            const progress = document.getElementById('decode-progress');
+            const decodeBtn = this.byId('decode-btn');
+            const progress = this.byId('decode-progress');
             decodeBtn.disabled = true;
-            progress.style.display = 'block';
+            this.showProgress(progress);
 
             // Decode
-            const binaryData = await SteganographyEngine.decodeImage(this.decodeImage, password);
+            const decodeImg = await this.getDecodedImage(file);
+            const { data, legacy } = await SteganographyEngine.decodeImage(
+                decodeImg, password, (fraction) => this.updateProgress(progress, fraction)
+            );
+
+            // The image was removed or replaced meanwhile; its results are no longer wanted
+            if (this.decodeImage !== file) {
+                decodeBtn.disabled = false;
+                progress.style.display = 'none';
+                return;
+            }
 
             // Try to determine if it's text or file
             try {
                 // Check if it starts with file metadata (32 bits for filename length)
-                if (binaryData.length >= 32) {
-                    const filenameLengthBinary = binaryData.substring(0, 32);
-                    const filenameLength = parseInt(filenameLengthBinary, 2);
+                if (data.length >= 4) {
+                    const filenameLength = SteganographyEngine.bytesToUint32(data, 0);
 
                     // If filename length is reasonable (1-255 chars), it's probably a file
                     if (filenameLength > 0 && filenameLength < 256) {
-                        const fileData = SteganographyEngine.binaryToFile(binaryData);
+                        const fileData = SteganographyEngine.bytesToFile(data, legacy);
                         this.showDecodedFile(fileData);
                         this.showToast('File extracted successfully!', 'success');
                     } else {
@@ -709,7 +1198,7 @@ class UIController {
                 }
             } catch (fileErr) {
                 // Treat as text
-                const text = SteganographyEngine.binaryToText(binaryData);
+                const text = SteganographyEngine.bytesToText(data, legacy);
                 this.showDecodedText(text);
                 this.showToast('Text extracted successfully!', 'success');
             }
@@ -719,37 +1208,77 @@ class UIController {
             progress.style.display = 'none';
 
         } catch (err) {
-            document.getElementById('decode-btn').disabled = false;
-            document.getElementById('decode-progress').style.display = 'none';
-            this.showToast(err.message, 'error');
+            this.byId('decode-btn').disabled = false;
+            this.byId('decode-progress').style.display = 'none';
+            if (this.decodeImage === file) this.showToast(err.message, 'error');
         }
     }
 
+    // Show a progress bar in its indeterminate state until the first report arrives
+    showProgress(progressBar) {
+        progressBar.classList.remove('determinate');
+        progressBar.firstElementChild.style.transform = '';
+        progressBar.removeAttribute('aria-valuenow');
+        progressBar.style.display = 'block';
+    }
+
+    // Report worker progress on a progress bar
+    updateProgress(progressBar, fraction) {
+        progressBar.classList.add('determinate');
+        progressBar.firstElementChild.style.transform = `scaleX(${fraction})`;
+        progressBar.setAttribute('aria-valuenow', Math.round(fraction * 100));
+    }
+
+    // Hide the results card and release the decoded data behind it
+    clearDecodedResults() {
+        this.byId('results-card').style.display = 'none';
+        if (this.decodedText === null && this.decodedFileData === null) return;
+
+        this.decodedText = null;
+        this.decodedFileData = null;
+        const textArea = this.byId('decoded-text');
+        if (textArea.value) textArea.value = '';
+    }
+
     // Show decoded text
     showDecodedText(text) {
-        document.getElementById('results-card').style.display = 'block';
-        document.getElementById('decoded-text-container').style.display = 'block';
-        document.getElementById('decoded-file-container').style.display = 'none';
-        document.getElementById('decoded-text').value = text;
+        this.decodedFileData = null;
+        
+        this.byId('results-card').style.display = 'block';
+        this.byId('decoded-text-container').style.display = 'block';
+        this.byId('decoded-file-container').style.display = 'none';
+
+        // Very long messages make the textarea lay out megabytes of text; show the head
+        // of the message and keep the full text for copying
+        this.decodedText = text;
+        const truncated = text.length > DECODED_TEXT_PREVIEW_CHARS;
+        this.byId('decoded-text').value = truncated ? text.slice(0, DECODED_TEXT_PREVIEW_CHARS) : text;
+        if (truncated) {
+            this.showToast(`Showing the first ${DECODED_TEXT_PREVIEW_CHARS.toLocaleString()} characters. Copy includes the full message.`, 'info');
+        }
     }
 
     // Show decoded file
     showDecodedFile(fileData) {
         this.decodedFileData = fileData;
+        this.decodedText = null;
+        const textArea = this.byId('decoded-text');
+        if (textArea.value) textArea.value = '';
         
-        document.getElementById('results-card').style.display = 'block';
-        document.getElementById('decoded-text-container').style.display = 'none';
-        document.getElementById('decoded-file-container').style.display = 'block';
+        this.byId('results-card').style.display = 'block';
+        this.byId('decoded-text-container').style.display = 'none';
+        this.byId('decoded-file-container').style.display = 'block';
         
-        document.getElementById('decoded-file-name').textContent = fileData.filename;
+        this.byId('decoded-file-name').textContent = fileData.filename;
         const sizeKB = (fileData.size / 1024).toFixed(2);
-        document.getElementById('decoded-file-size').textContent = `Size: ${sizeKB} KB`;
+        this.byId('decoded-file-size').textContent = `Size: ${sizeKB} KB`;
     }
 
     // Copy decoded text
     copyDecodedText() {
-        const text = document.getElementById('decoded-text').value;
-        navigator.clipboard.writeText(text).then(() => {
+        if (this.decodedText === null) return;
+
+        navigator.clipboard.writeText(this.decodedText).then(() => {
             this.showToast('Text copied to clipboard!', 'success');
         });
     }
@@ -758,8 +1287,7 @@ class UIController {
     downloadDecodedFile() {
         if (!this.decodedFileData) return;
 
-        const blob = new Blob([this.decodedFileData.data]);
-        const url = URL.createObjectURL(blob);
+        const url = URL.createObjectURL(this.decodedFileData.blob);
         const a = document.createElement('a');
         a.href = url;
         a.download = this.decodedFileData.filename;
@@ -771,7 +1299,7 @@ class UIController {
 
     // Show toast notification
     showToast(message, type = 'info') {
-        const container = document.getElementById('toast-container');
+        const container = this.byId('toast-container');
         const toast = document.createElement('div');
         toast.className = `toast toast-${type}`;
         
@@ -824,11 +1352,16 @@ class MobileMenuManager {
             });
         });
         
-        // Close menu on window resize if desktop
+        // Close menu on window resize if desktop (at most once per frame)
+        let resizeFrame = null;
         window.addEventListener('resize', () => {
-            if (window.innerWidth > 768) {
-                this.closeMenu();
-            }
+            if (resizeFrame) return;
+            resizeFrame = requestAnimationFrame(() => {
+                resizeFrame = null;
+                if (window.innerWidth > 768) {
+                    this.closeMenu();
+                }
+            });
         });
     }
     
@@ -881,6 +1414,7 @@ class ThemeManager {
         };
         
         this.currentTheme = 'teal';
+        this.saveTimer = null;
         this.init();
     }
     
@@ -889,36 +1423,40 @@ class ThemeManager {
         const pickerBtn = document.getElementById('theme-picker-btn');
         const pickerPanel = document.getElementById('theme-picker-panel');
         
+        // Close panel when clicking outside; only listened for while the panel is open
+        const closeOnOutsideClick = (e) => {
+            if (!e.target.closest('.theme-picker') && 
+                !e.target.closest('.theme-picker-btn-mobile') &&
+                !e.target.closest('.theme-picker-panel')) {
+                setPanelVisible(false);
+            }
+        };
+        const setPanelVisible = (visible) => {
+            if (!pickerPanel) return;
+            pickerPanel.style.display = visible ? 'block' : 'none';
+            if (visible) {
+                document.addEventListener('click', closeOnOutsideClick);
+            } else {
+                document.removeEventListener('click', closeOnOutsideClick);
+            }
+        };
+        const togglePanel = (e) => {
+            e.stopPropagation();
+            if (pickerPanel) {
+                setPanelVisible(pickerPanel.style.display !== 'block');
+            }
+        };
+        
         if (pickerBtn && pickerPanel) {
-            pickerBtn.addEventListener('click', (e) => {
-                e.stopPropagation();
-                const isVisible = pickerPanel.style.display === 'block';
-                pickerPanel.style.display = isVisible ? 'none' : 'block';
-            });
+            pickerBtn.addEventListener('click', togglePanel);
         }
         
         // Mobile theme picker
         const pickerBtnMobile = document.getElementById('theme-picker-btn-mobile');
         if (pickerBtnMobile) {
-            pickerBtnMobile.addEventListener('click', (e) => {
-                e.stopPropagation();
-                if (pickerPanel) {
-                    const isVisible = pickerPanel.style.display === 'block';
-                    pickerPanel.style.display = isVisible ? 'none' : 'block';
-                }
-            });
+            pickerBtnMobile.addEventListener('click', togglePanel);
         }
         
-        // Close panel when clicking outside
-        document.addEventListener('click', (e) => {
-            if (!e.target.closest('.theme-picker') && 
-                !e.target.closest('.theme-picker-btn-mobile') &&
-                !e.target.closest('.theme-picker-panel') &&
-                pickerPanel) {
-                pickerPanel.style.display = 'none';
-            }
-        });
-        
         // Theme color buttons
         const colorButtons = document.querySelectorAll('.theme-color-btn');
         colorButtons.forEach(btn => {
@@ -931,16 +1469,24 @@ class ThemeManager {
                 btn.classList.add('active');
                 
                 // Close panel on mobile
-                if (pickerPanel) {
-                    pickerPanel.style.display = 'none';
-                }
+                setPanelVisible(false);
             });
         });
         
+        // Write a pending save before the page is hidden or unloaded, so it isn't lost
+        const flushSave = () => {
+            if (this.saveTimer !== null) this.saveTheme();
+        };
+        window.addEventListener('pagehide', flushSave);
+        document.addEventListener('visibilitychange', () => {
+            if (document.visibilityState === 'hidden') flushSave();
+        });
+        
         // Load saved theme
         const savedTheme = localStorage.getItem('steganocrypt-theme');
         if (savedTheme && this.themes[savedTheme]) {
-            this.changeTheme(savedTheme);
+            // Restoring needs neither the transition nor writing the value straight back
+            this.applyTheme(savedTheme);
             colorButtons.forEach(btn => {
                 if (btn.dataset.theme === savedTheme) {
                     btn.classList.add('active');
@@ -951,8 +1497,11 @@ class ThemeManager {
         }
     }
     
-    changeTheme(themeName) {
-        if (!this.themes[themeName]) return;
+    // Point the theme CSS variables at a theme's colors; returns whether anything changed
+    applyTheme(themeName) {
+        // The stylesheet already carries the active theme's colors; re-applying them would
+        // only invalidate styles across the page for no visible change
+        if (!this.themes[themeName] || themeName === this.currentTheme) return false;
         
         const theme = this.themes[themeName];
         this.currentTheme = themeName;
@@ -960,9 +1509,22 @@ class ThemeManager {
         // Update CSS variables
         document.documentElement.style.setProperty('--theme-color-1', theme.color1);
         document.documentElement.style.setProperty('--theme-color-2', theme.color2);
+        return true;
+    }
+    
+    // Persist the current theme, cancelling any pending delayed save
+    saveTheme() {
+        clearTimeout(this.saveTimer);
+        this.saveTimer = null;
+        localStorage.setItem('steganocrypt-theme', this.currentTheme);
+    }
+    
+    changeTheme(themeName) {
+        if (!this.applyTheme(themeName)) return;
         
-        // Save to localStorage
-        localStorage.setItem('steganocrypt-theme', themeName);
+        // Save to localStorage once the user settles on a theme
+        clearTimeout(this.saveTimer);
+        this.saveTimer = setTimeout(() => this.saveTheme(), 300);
         
         // Add smooth transition effect
         document.body.style.transition = 'background 0.5s ease-in-out';